@@ -5,7 +5,11 @@ Main FastAPI application entry point
 
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+import anyio
+import asyncio
 import uvicorn
 import os
 from dotenv import load_dotenv
@@ -15,13 +19,32 @@ from app.routes import transcribe, summarize
 # Load environment variables
 load_dotenv()
 
+def configure_threadpool():
+    """Size the threadpools used for blocking work (uploads, model inference)"""
+    threadpool_size = int(os.getenv("THREADPOOL_SIZE", 80))
+    # Used by Starlette for sync endpoints and UploadFile I/O
+    anyio.to_thread.current_default_thread_limiter().total_tokens = threadpool_size
+    # Used by asyncio.to_thread in the services
+    asyncio.get_running_loop().set_default_executor(ThreadPoolExecutor(max_workers=threadpool_size))
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Load and warm up models once per process before accepting requests"""
+    configure_threadpool()
+    transcribe.whisper_service.load_model()
+    await transcribe.whisper_service.warmup()
+    await summarize.llm_service.warmup()
+    yield
+
 # Create FastAPI app
 app = FastAPI(
     title="Voice-to-Summary AI Notepad API",
     description="A production-ready backend for audio transcription and AI summarization",
     version="1.0.0",
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan
 )
 
 # Configure CORS
@@ -58,7 +81,10 @@ async def health_check():
 @app.exception_handler(Exception)
 async def global_exception_handler(request, exc):
     """Global exception handler"""
-    return JSONResponse(
+    # Runs in ServerErrorMiddleware, outside CORS, and Starlette logs the
+    # traceback itself; routes convert their own failures into HTTP 500s so
+    # browser clients still see the error detail
+    return ORJSONResponse(
         status_code=500,
         content={"error": "Internal server error", "detail": str(exc)}
     )
@@ -73,5 +99,7 @@ if __name__ == "__main__":
         host=host,
         port=port,
         reload=debug,
+        loop="auto",
+        http="auto",
         log_level="info"
     ) 
\ No newline at end of file
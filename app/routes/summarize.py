@@ -3,7 +3,9 @@ Summarization route for handling text summarization requests
 """
 
 from fastapi import APIRouter, HTTPException
-from fastapi.responses import JSONResponse
+from fastapi.responses import StreamingResponse
+import asyncio
+import json
 import logging
 from typing import Optional
 
@@ -19,6 +21,26 @@ router = APIRouter()
 # Initialize LLM service
 llm_service = LLMService()
 
+def _build_summary_response(index: int, original_length: int, style, result) -> SummaryResponse:
+    """Build the SummaryResponse for one batch item from its result or error"""
+    if isinstance(result, Exception):
+        logger.error(f"Error processing text {index}: {str(result)}")
+        return SummaryResponse(
+            summary=f"Error: {str(result)}",
+            word_count=0,
+            original_length=original_length,
+            style=style,
+            model_used="error"
+        )
+    
+    return SummaryResponse(
+        summary=result["summary"],
+        word_count=result.get("word_count", 0),
+        original_length=original_length,
+        style=style,
+        model_used=result.get("model_used", "unknown")
+    )
+
 @router.post("/summarize", response_model=SummaryResponse)
 async def summarize_text(request: SummaryRequest):
     """
@@ -31,13 +53,6 @@ async def summarize_text(request: SummaryRequest):
         SummaryResponse: Contains summary, word count, and metadata
     """
     try:
-        # Validate input
-        if not request.text or len(request.text.strip()) == 0:
-            raise HTTPException(status_code=400, detail="Text cannot be empty")
-        
-        if len(request.text) < 10:
-            raise HTTPException(status_code=400, detail="Text too short for summarization")
-        
         logger.info(f"Summarizing text of length: {len(request.text)}")
         
         # Generate summary
@@ -57,10 +72,44 @@ async def summarize_text(request: SummaryRequest):
             model_used=result.get("model_used", "unknown")
         )
         
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Error summarizing text: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Summarization failed: {str(e)}")
 
+@router.post("/summarize/stream")
+async def summarize_text_stream(request: SummaryRequest):
+    """
+    Summarize the provided text, streaming the summary as Server-Sent Events.
+    
+    Each event carries a JSON object with the next piece of the summary in
+    "delta". The stream ends with a "[DONE]" event, or an "error" event if
+    summarization fails part-way.
+    
+    Args:
+        request: SummaryRequest containing text and parameters
+        
+    Returns:
+        StreamingResponse: text/event-stream of summary pieces
+    """
+    logger.info(f"Streaming summary for text of length: {len(request.text)}")
+    
+    async def event_stream():
+        try:
+            async for delta in llm_service.summarize_stream(
+                text=request.text,
+                max_length=request.max_length,
+                style=request.style
+            ):
+                yield f"data: {json.dumps({'delta': delta})}\n\n"
+            yield "data: [DONE]\n\n"
+        except Exception as e:
+            logger.error(f"Error streaming summary: {str(e)}")
+            yield f"event: error\ndata: {json.dumps({'error': str(e)})}\n\n"
+    
+    return StreamingResponse(event_stream(), media_type="text/event-stream")
+
 @router.get("/summarize/status")
 async def summarization_status():
     """
@@ -84,16 +133,28 @@ async def summarization_status():
             "error": str(e)
         }
 
+@router.get("/summarize/cache/stats")
+async def summarization_cache_stats():
+    """
+    Get hit-rate statistics for the summary response cache.
+    
+    Returns:
+        dict: Cache size, hits, misses, and hit rate
+    """
+    return llm_service.get_cache_stats()
+
 @router.post("/summarize/batch")
-async def summarize_batch_texts(request: list[SummaryRequest]):
+async def summarize_batch_texts(request: list[SummaryRequest], synchronous: bool = True):
     """
     Summarize multiple texts in batch.
     
     Args:
         request: List of SummaryRequest objects
+        synchronous: When false, submit the texts to the provider's batch API
+            and return a batch id to poll instead of waiting for summaries
         
     Returns:
-        List of SummaryResponse objects
+        List of SummaryResponse objects, or the submitted batch id
     """
     try:
         if not request or len(request) == 0:
@@ -102,38 +163,89 @@ async def summarize_batch_texts(request: list[SummaryRequest]):
         if len(request) > 10:
             raise HTTPException(status_code=400, detail="Too many texts for batch processing (max 10)")
         
+        if not synchronous:
+            if llm_service.llm_provider != "openai":
+                raise HTTPException(
+                    status_code=400,
+                    detail="Asynchronous batch summarization requires the OpenAI provider"
+                )
+            
+            batch_id = await llm_service.submit_batch(
+                [(req.text, req.max_length, req.style) for req in request]
+            )
+            logger.info(f"Submitted batch {batch_id} for {len(request)} texts")
+            return {"batch_id": batch_id, "status": "submitted"}
+        
         logger.info(f"Processing batch summarization for {len(request)} texts")
         
-        results = []
+        # Group texts sharing the same parameters so each group can be
+        # batched by the provider, and run all groups concurrently
+        groups: dict[tuple, list[int]] = {}
         for i, req in enumerate(request):
-            try:
-                result = await llm_service.summarize(
-                    text=req.text,
-                    max_length=req.max_length,
-                    style=req.style
-                )
-                
-                results.append(SummaryResponse(
-                    summary=result["summary"],
-                    word_count=result.get("word_count", 0),
-                    original_length=len(req.text),
-                    style=req.style,
-                    model_used=result.get("model_used", "unknown")
-                ))
-                
-            except Exception as e:
-                logger.error(f"Error processing text {i}: {str(e)}")
-                results.append(SummaryResponse(
-                    summary=f"Error: {str(e)}",
-                    word_count=0,
-                    original_length=len(req.text),
-                    style=req.style,
-                    model_used="error"
-                ))
+            groups.setdefault((req.max_length, req.style), []).append(i)
+        
+        group_results = await asyncio.gather(*(
+            llm_service.summarize_many(
+                [request[i].text for i in indices],
+                max_length=max_length,
+                style=style
+            )
+            for (max_length, style), indices in groups.items()
+        ))
+        
+        outcomes = [None] * len(request)
+        for indices, group_result in zip(groups.values(), group_results):
+            for i, outcome in zip(indices, group_result):
+                outcomes[i] = outcome
+        
+        results = [
+            _build_summary_response(i, len(req.text), req.style, result)
+            for i, (req, result) in enumerate(zip(request, outcomes))
+        ]
         
         logger.info(f"Batch summarization completed for {len(results)} texts")
         return results
         
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Error in batch summarization: {str(e)}")
-        raise HTTPException(status_code=500, detail=f"Batch summarization failed: {str(e)}") 
\ No newline at end of file
+        raise HTTPException(status_code=500, detail=f"Batch summarization failed: {str(e)}")
+
+@router.get("/summarize/batch/{batch_id}")
+async def get_batch_summaries(batch_id: str):
+    """
+    Get the status of a batch submitted with synchronous=false, and its
+    summaries once the provider has completed it.
+    
+    Args:
+        batch_id: Batch id returned when the batch was submitted
+        
+    Returns:
+        dict: Batch status, plus a list of SummaryResponse objects when completed
+    """
+    try:
+        batch = await llm_service.get_batch(batch_id)
+        if batch is None:
+            raise HTTPException(status_code=404, detail=f"Unknown batch id: {batch_id}")
+        
+        if batch["results"] is None:
+            return {"batch_id": batch_id, "status": batch["status"]}
+        
+        results = [
+            _build_summary_response(
+                i,
+                original_length,
+                style,
+                batch["results"].get(str(i), Exception("No result returned by provider"))
+            )
+            for i, (original_length, style) in enumerate(batch["items"])
+        ]
+        
+        return {"batch_id": batch_id, "status": batch["status"], "results": results}
+        
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error fetching batch summaries: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"Fetching batch summaries failed: {str(e)}")
\ No newline at end of file
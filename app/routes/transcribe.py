@@ -3,9 +3,12 @@ Transcription route for handling audio file uploads
 """
 
 from fastapi import APIRouter, UploadFile, File, HTTPException, Depends
-from fastapi.responses import JSONResponse
+from fastapi.responses import StreamingResponse
+from starlette.background import BackgroundTask
+import json
 import logging
-from typing import Optional
+import contextlib
+from typing import List
 
 from app.services.whisper_service import WhisperService
 from app.utils.audio_utils import validate_audio_file
@@ -59,10 +62,125 @@ async def transcribe_audio(
             duration=result.get("duration", 0.0)
         )
         
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Error transcribing audio: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Transcription failed: {str(e)}")
 
+def _build_transcription_response(index: int, result) -> TranscriptionResponse:
+    """Build the TranscriptionResponse for one batch item from its result or error"""
+    if isinstance(result, Exception):
+        logger.error(f"Error transcribing file {index}: {str(result)}")
+        return TranscriptionResponse(
+            transcript=f"Error: {str(result)}",
+            confidence=0.0,
+            language="unknown",
+            duration=0.0
+        )
+    
+    return TranscriptionResponse(
+        transcript=result["transcript"],
+        confidence=result.get("confidence", 0.0),
+        language=result.get("language", "en"),
+        duration=result.get("duration", 0.0)
+    )
+
+@router.post("/transcribe/batch", response_model=List[TranscriptionResponse])
+async def transcribe_audio_batch(
+    files: List[UploadFile] = File(..., description="Audio files to transcribe (MP3, WAV, or raw audio)")
+):
+    """
+    Transcribe multiple audio files in one request.
+    
+    Args:
+        files: Audio files (MP3, WAV, or raw audio)
+        
+    Returns:
+        List of TranscriptionResponse objects, in the order the files were sent
+    """
+    try:
+        if not files:
+            raise HTTPException(status_code=400, detail="No files provided for batch transcription")
+        
+        if len(files) > 10:
+            raise HTTPException(status_code=400, detail="Too many files for batch processing (max 10)")
+        
+        for file in files:
+            if not validate_audio_file(file):
+                raise HTTPException(
+                    status_code=400,
+                    detail=f"Invalid audio file format: {file.filename}. Supported formats: MP3, WAV, M4A, FLAC"
+                )
+        
+        logger.info(f"Processing batch transcription for {len(files)} files")
+        
+        results = await whisper_service.transcribe_batch(files)
+        
+        logger.info(f"Batch transcription completed for {len(results)} files")
+        
+        return [_build_transcription_response(i, result) for i, result in enumerate(results)]
+        
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error in batch transcription: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"Batch transcription failed: {str(e)}")
+
+@router.post("/transcribe/stream")
+async def transcribe_audio_stream(
+    file: UploadFile = File(..., description="Audio file to transcribe (MP3, WAV, or raw audio)")
+):
+    """
+    Transcribe an uploaded audio file, streaming segments as Server-Sent Events.
+    
+    Each event carries a JSON object with the start, end, and text of the
+    next transcribed segment. The stream ends with a "[DONE]" event, or an
+    "error" event if transcription fails part-way.
+    
+    Args:
+        file: Audio file (MP3, WAV, or raw audio)
+        
+    Returns:
+        StreamingResponse: text/event-stream of transcript segments
+    """
+    if not file.filename:
+        raise HTTPException(status_code=400, detail="No file provided")
+    
+    if not validate_audio_file(file):
+        raise HTTPException(
+            status_code=400, 
+            detail="Invalid audio file format. Supported formats: MP3, WAV, M4A, FLAC"
+        )
+    
+    logger.info(f"Streaming transcription for audio file: {file.filename}")
+    
+    # Spool the upload before responding: the upload is closed once this
+    # endpoint returns, before the stream body is sent. The temp file is
+    # released by a background task after the stream ends
+    stack = contextlib.AsyncExitStack()
+    try:
+        temp_file = await stack.enter_async_context(whisper_service.spool_upload(file))
+    except Exception as e:
+        await stack.aclose()
+        logger.error(f"Error saving audio file for streaming: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"Transcription failed: {str(e)}")
+    
+    async def event_stream():
+        try:
+            async for segment in whisper_service.transcribe_stream(temp_file, file.filename):
+                yield f"data: {json.dumps(segment)}\n\n"
+            yield "data: [DONE]\n\n"
+        except Exception as e:
+            logger.error(f"Error streaming transcription: {str(e)}")
+            yield f"event: error\ndata: {json.dumps({'error': str(e)})}\n\n"
+    
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        background=BackgroundTask(stack.aclose)
+    )
+
 @router.get("/transcribe/status")
 async def transcription_status():
     """
@@ -2,7 +2,7 @@
 Pydantic schemas for API request/response models
 """
 
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 from typing import Optional, Literal
 from enum import Enum
 
@@ -16,23 +16,12 @@ class SummaryStyle(str, Enum):
 class SummaryRequest(BaseModel):
     """Request model for text summarization"""
     
+    # Strip before the min_length constraint is checked
+    model_config = ConfigDict(str_strip_whitespace=True)
+    
     text: str = Field(..., description="Text to be summarized", min_length=10)
     max_length: int = Field(150, description="Maximum length of summary in words", ge=10, le=500)
     style: SummaryStyle = Field(SummaryStyle.BULLET_POINTS, description="Summary style")
-    
-    @validator('text')
-    def validate_text(cls, v):
-        if not v or not v.strip():
-            raise ValueError('Text cannot be empty')
-        return v.strip()
-    
-    @validator('max_length')
-    def validate_max_length(cls, v):
-        if v < 10:
-            raise ValueError('Maximum length must be at least 10 words')
-        if v > 500:
-            raise ValueError('Maximum length cannot exceed 500 words')
-        return v
 
 class SummaryResponse(BaseModel):
     """Response model for text summarization"""
@@ -54,9 +43,10 @@ class TranscriptionResponse(BaseModel):
 class BatchSummaryRequest(BaseModel):
     """Request model for batch summarization"""
     
-    texts: list[SummaryRequest] = Field(..., description="List of texts to summarize", max_items=10)
+    texts: list[SummaryRequest] = Field(..., description="List of texts to summarize", max_length=10)
     
-    @validator('texts')
+    @field_validator('texts')
+    @classmethod
     def validate_texts(cls, v):
         if not v:
             raise ValueError('At least one text must be provided')
@@ -4,18 +4,79 @@ Supports both OpenAI GPT and Hugging Face models
 """
 
 import os
+import asyncio
+import hashlib
+import json
 import logging
+import math
 import re
-from typing import Dict, Any, Optional
-import openai
+from typing import Dict, Any, AsyncIterator, Callable, Optional, Tuple, Union
+import torch
+from cachetools import LFUCache
+from openai import AsyncOpenAI, NotFoundError
 from transformers import pipeline, AutoTokenizer, AutoModelForSeq2SeqLM
 from dotenv import load_dotenv
 
+from app.schemas.summary import SummaryStyle
+
 # Load environment variables
 load_dotenv()
 
 logger = logging.getLogger(__name__)
 
+# Sentence boundaries used when converting summaries to bullet points
+_SENTENCE_SPLIT = re.compile(r'[.!?]+')
+
+# Static part of the OpenAI system prompt, shared by every style
+_SYSTEM_PROMPT_BASE = (
+    "You are an AI assistant specialized in creating clear and concise summaries. "
+    "Please summarize the text provided by the user clearly and concisely. "
+)
+_SYSTEM_PROMPT_SUFFIX = f"Keep the summary under {150} words."
+
+# Style-specific instructions appended to the system prompt
+_STYLE_INSTRUCTIONS: dict[SummaryStyle, str] = {
+    SummaryStyle.BULLET_POINTS: "Use bullet points to highlight key information and action items. ",
+    SummaryStyle.PARAGRAPH: "Provide a coherent paragraph summary. ",
+    SummaryStyle.EXECUTIVE: "Create an executive summary suitable for business presentations. ",
+    SummaryStyle.TECHNICAL: "Provide a technical summary with specific details and terminology. ",
+}
+
+# Fully built system prompts, one per style
+_SYSTEM_PROMPTS: dict[SummaryStyle, str] = {
+    style: _SYSTEM_PROMPT_BASE + instructions + _SYSTEM_PROMPT_SUFFIX
+    for style, instructions in _STYLE_INSTRUCTIONS.items()
+}
+
+def _format_bullet_points(summary: str) -> str:
+    """Convert sentences to bullet points"""
+    bullet_points = []
+    for sentence in _SENTENCE_SPLIT.split(summary):
+        sentence = sentence.strip()
+        if sentence and len(sentence) > 10:  # Only meaningful sentences
+            bullet_points.append(f"• {sentence}")
+    return "\n".join(bullet_points)
+
+def _format_paragraph(summary: str) -> str:
+    """Default paragraph style"""
+    return summary
+
+def _format_executive(summary: str) -> str:
+    """Add executive summary formatting"""
+    return f"EXECUTIVE SUMMARY:\n\n{summary}"
+
+def _format_technical(summary: str) -> str:
+    """Add technical summary formatting"""
+    return f"TECHNICAL SUMMARY:\n\n{summary}"
+
+# Formatter applied to Hugging Face summaries for each style
+_STYLE_FORMATTERS: dict[SummaryStyle, Callable[[str], str]] = {
+    SummaryStyle.BULLET_POINTS: _format_bullet_points,
+    SummaryStyle.PARAGRAPH: _format_paragraph,
+    SummaryStyle.EXECUTIVE: _format_executive,
+    SummaryStyle.TECHNICAL: _format_technical,
+}
+
 class LLMService:
     """Service for handling text summarization using LLM models"""
     
@@ -23,23 +84,51 @@ class LLMService:
         self.llm_provider = os.getenv("LLM_PROVIDER", "openai").lower()
         self.openai_api_key = os.getenv("OPENAI_API_KEY")
         self.openai_model = os.getenv("OPENAI_MODEL", "gpt-4")
+        self.openai_prompt_warmup = os.getenv("OPENAI_PROMPT_WARMUP", "false").lower() == "true"
         self.huggingface_model = os.getenv("HUGGINGFACE_MODEL", "facebook/bart-large-cnn")
+        self.huggingface_precision = os.getenv("HUGGINGFACE_PRECISION", "auto").lower()
+        self.chunk_overlap = int(os.getenv("HUGGINGFACE_CHUNK_OVERLAP", 64))
+        self.batch_size = int(os.getenv("HUGGINGFACE_BATCH_SIZE", 8))
+        
+        # Queue feeding the background worker that batches concurrent
+        # Hugging Face summarizer calls
+        self.hf_queue = asyncio.Queue()
+        self.hf_worker = None
+        self.hf_queue_max_requests = int(os.getenv("HUGGINGFACE_QUEUE_MAX_REQUESTS", 8))
+        self.hf_queue_wait_ms = float(os.getenv("HUGGINGFACE_QUEUE_WAIT_MS", 10))
+        
+        # In-memory LFU cache of summaries keyed by (text hash, style, max_length)
+        self.cache = LFUCache(maxsize=int(os.getenv("SUMMARY_CACHE_SIZE", 1024)))
+        self.cache_lock = asyncio.Lock()
+        self.cache_hits = 0
+        self.cache_misses = 0
         
         # Initialize models based on provider
         self.summarizer = None
         self.tokenizer = None
         self.model = None
+        self.openai_client = None
         
         if self.llm_provider == "openai":
             if not self.openai_api_key:
                 raise Exception("OpenAI API key required when using OpenAI provider")
-            openai.api_key = self.openai_api_key
+            self.openai_client = AsyncOpenAI(api_key=self.openai_api_key)
             logger.info(f"OpenAI LLM configured with model: {self.openai_model}")
             
         elif self.llm_provider == "huggingface":
             try:
                 logger.info(f"Loading Hugging Face model: {self.huggingface_model}")
-                self.summarizer = pipeline("summarization", model=self.huggingface_model)
+                self.tokenizer = AutoTokenizer.from_pretrained(self.huggingface_model)
+                # Batched generation needs a pad token to pad inputs to equal length
+                if self.tokenizer.pad_token is None:
+                    self.tokenizer.pad_token = self.tokenizer.eos_token
+                self.model, device = self._load_huggingface_model()
+                self.summarizer = pipeline(
+                    "summarization",
+                    model=self.model,
+                    tokenizer=self.tokenizer,
+                    device=device
+                )
                 logger.info("Hugging Face model loaded successfully")
             except Exception as e:
                 logger.error(f"Failed to load Hugging Face model: {str(e)}")
@@ -48,6 +137,39 @@ class LLMService:
         else:
             raise Exception(f"Unsupported LLM provider: {self.llm_provider}")
     
+    def _load_huggingface_model(self) -> Tuple[Any, int]:
+        """
+        Load the Hugging Face model at the configured precision.
+        
+        "auto" uses bf16 (or fp16 where bf16 is unsupported) on GPU and
+        dynamic int8 quantization of the Linear layers on CPU.
+        
+        Returns:
+            Tuple of the loaded model and the pipeline device index
+        """
+        use_cuda = torch.cuda.is_available()
+        precision = self.huggingface_precision
+        if precision == "auto":
+            if use_cuda:
+                precision = "bf16" if torch.cuda.is_bf16_supported() else "fp16"
+            else:
+                precision = "int8"
+        
+        dtypes = {"fp32": torch.float32, "fp16": torch.float16, "bf16": torch.bfloat16, "int8": torch.float32}
+        if precision not in dtypes:
+            raise Exception(f"Unsupported Hugging Face precision: {precision}")
+        
+        logger.info(f"Loading Hugging Face model with {precision} precision")
+        model = AutoModelForSeq2SeqLM.from_pretrained(self.huggingface_model, torch_dtype=dtypes[precision])
+        
+        device = 0 if use_cuda else -1
+        if precision == "int8":
+            # Dynamic int8 quantization is only supported on CPU
+            model = torch.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8)
+            device = -1
+        
+        return model, device
+    
     async def summarize(self, text: str, max_length: int = 150, style: str = "bullet_points") -> Dict[str, Any]:
         """
         Summarize text using the configured LLM provider.
@@ -60,36 +182,259 @@ class LLMService:
         Returns:
             Dict containing summary, word count, and model information
         """
+        key = self._cache_key(text, max_length, style)
+        cached = self._cache_get(key)
+        if cached is not None:
+            return cached
+        
         try:
             if self.llm_provider == "openai":
-                return await self._summarize_with_openai(text, max_length, style)
+                result = await self._summarize_with_openai(text, max_length, style)
             elif self.llm_provider == "huggingface":
-                return await self._summarize_with_huggingface(text, max_length, style)
+                result = await self._summarize_with_huggingface(text, max_length, style)
             else:
                 raise Exception(f"Unsupported LLM provider: {self.llm_provider}")
+            
+            await self._cache_put(key, result)
+            return result
                 
         except Exception as e:
             logger.error(f"Summarization failed: {str(e)}")
             raise Exception(f"Summarization failed: {str(e)}")
     
+    async def summarize_many(self, texts: list[str], max_length: int = 150, style: str = "bullet_points") -> list[Union[Dict[str, Any], Exception]]:
+        """
+        Summarize several texts that share the same parameters.
+        
+        OpenAI requests are issued concurrently; Hugging Face texts are run
+        through the pipeline together so they share GPU forward passes.
+        
+        Args:
+            texts: Texts to summarize
+            max_length: Maximum length of each summary in words
+            style: Summary style (bullet_points, paragraph, executive, technical)
+            
+        Returns:
+            List with one result dict per text, or the exception raised for it
+        """
+        if self.llm_provider == "huggingface":
+            keys = [self._cache_key(text, max_length, style) for text in texts]
+            results = [self._cache_get(key) for key in keys]
+            missing = [i for i, result in enumerate(results) if result is None]
+            if not missing:
+                return results
+            
+            try:
+                summaries = await self._summarize_many_with_huggingface(
+                    [texts[i] for i in missing], max_length, style
+                )
+            except Exception as e:
+                logger.error(f"Batch summarization failed: {str(e)}")
+                summaries = [Exception(f"Summarization failed: {str(e)}") for _ in missing]
+            else:
+                for i, summary in zip(missing, summaries):
+                    await self._cache_put(keys[i], summary)
+            
+            for i, summary in zip(missing, summaries):
+                results[i] = summary
+            return results
+        
+        return await asyncio.gather(
+            *(self.summarize(text, max_length, style) for text in texts),
+            return_exceptions=True
+        )
+    
+    async def submit_batch(self, items: list[Tuple[str, int, str]]) -> str:
+        """
+        Submit texts to the OpenAI Batch API for asynchronous summarization.
+        
+        The length and style of each text are stored in the batch metadata,
+        so any worker process can rebuild the responses when it is polled.
+        
+        Args:
+            items: (text, max_length, style) for each text; results are keyed
+                by the item's index as a string
+            
+        Returns:
+            The provider batch id
+        """
+        if self.llm_provider != "openai":
+            raise Exception("Asynchronous batch summarization requires the OpenAI provider")
+        
+        lines = [
+            json.dumps({
+                "custom_id": str(i),
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": self._create_openai_params(text, max_length, style)
+            })
+            for i, (text, max_length, style) in enumerate(items)
+        ]
+        
+        batch_file = await self.openai_client.files.create(
+            file=("batch.jsonl", "\n".join(lines).encode()),
+            purpose="batch"
+        )
+        batch = await self.openai_client.batches.create(
+            input_file_id=batch_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h",
+            metadata={
+                "items": json.dumps(
+                    [[len(text), SummaryStyle(style).value] for text, _, style in items],
+                    separators=(",", ":")
+                )
+            }
+        )
+        
+        logger.info(f"Submitted OpenAI batch {batch.id} with {len(items)} requests")
+        return batch.id
+    
+    async def get_batch(self, batch_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Get the status of an OpenAI batch and its results once completed.
+        
+        Args:
+            batch_id: Provider batch id returned by submit_batch
+            
+        Returns:
+            Dict with the batch status, the (original_length, style) of each
+            item, and, when completed, a "results" dict mapping each
+            custom_id to a result dict or the exception for it. None if the
+            batch does not exist or was not submitted by submit_batch
+        """
+        if self.llm_provider != "openai":
+            return None
+        
+        try:
+            batch = await self.openai_client.batches.retrieve(batch_id)
+        except NotFoundError:
+            return None
+        
+        if not batch.metadata or "items" not in batch.metadata:
+            return None
+        items = [
+            (original_length, SummaryStyle(style))
+            for original_length, style in json.loads(batch.metadata["items"])
+        ]
+        
+        if batch.status != "completed":
+            return {"status": batch.status, "items": items, "results": None}
+        
+        # Successful requests land in the output file and failed ones in the
+        # error file; a batch where every request failed has only the latter
+        results = {}
+        for file_id in (batch.output_file_id, batch.error_file_id):
+            if file_id:
+                content = await self.openai_client.files.content(file_id)
+                results.update(self._parse_batch_results(content.text))
+        
+        return {"status": batch.status, "items": items, "results": results}
+    
+    def _parse_batch_results(self, content: str) -> Dict[str, Union[Dict[str, Any], Exception]]:
+        """Parse a batch output or error file into results keyed by custom_id"""
+        results = {}
+        for line in content.splitlines():
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            response = record.get("response") or {}
+            if response.get("status_code") != 200:
+                results[record["custom_id"]] = Exception(f"OpenAI batch request failed: {record.get('error') or response.get('body')}")
+                continue
+            
+            body = response["body"]
+            summary = body["choices"][0]["message"]["content"].strip()
+            results[record["custom_id"]] = {
+                "summary": summary,
+                "word_count": len(summary.split()),
+                "model_used": body.get("model", self.openai_model),
+                "provider": "openai"
+            }
+        
+        return results
+    
+    def _cache_key(self, text: str, max_length: int, style: str) -> tuple:
+        """Build the response cache key for a summarization request"""
+        digest = hashlib.blake2b(text.encode(), digest_size=16).digest()
+        # Normalize plain-string styles to SummaryStyle members so both
+        # share cache entries
+        return digest, SummaryStyle(style), max_length
+    
+    def _cache_get(self, key: tuple) -> Optional[Dict[str, Any]]:
+        """Look up a cached summary, recording the hit or miss"""
+        result = self.cache.get(key)
+        if result is None:
+            self.cache_misses += 1
+            return None
+        self.cache_hits += 1
+        return dict(result)
+    
+    async def _cache_put(self, key: tuple, result: Dict[str, Any]) -> None:
+        """Store a summary in the cache"""
+        async with self.cache_lock:
+            self.cache[key] = dict(result)
+    
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """Get hit-rate statistics for the summary cache"""
+        lookups = self.cache_hits + self.cache_misses
+        return {
+            "size": self.cache.currsize,
+            "max_size": self.cache.maxsize,
+            "hits": self.cache_hits,
+            "misses": self.cache_misses,
+            "hit_rate": self.cache_hits / lookups if lookups else 0.0
+        }
+    
+    async def warmup(self) -> None:
+        """
+        Run a dummy inference so the first real request doesn't pay model
+        warmup costs (kernel selection, allocator growth, graph capture).
+        
+        For OpenAI, optionally send one request per style so the provider's
+        prompt cache already holds every system prompt prefix.
+        """
+        if self.llm_provider == "openai":
+            if self.openai_prompt_warmup:
+                await self._warmup_openai_prompts()
+            return
+        
+        try:
+            logger.info("Warming up Hugging Face summarizer")
+            # Size the input near the 1024-token BART limit so the warmup
+            # exercises the same shapes as typical requests
+            self.summarizer(
+                "warmup text " * 400,
+                max_length=30,
+                min_length=10,
+                do_sample=False,
+                truncation=True
+            )
+            logger.info("Hugging Face summarizer warmup completed")
+        except Exception as e:
+            logger.warning(f"Hugging Face summarizer warmup failed: {str(e)}")
+    
+    async def _warmup_openai_prompts(self) -> None:
+        """Send one small request per style to seed the provider prompt cache"""
+        logger.info("Warming up OpenAI prompt cache")
+        # Bypass the response cache so every style actually reaches the provider
+        results = await asyncio.gather(
+            *(self._summarize_with_openai("warmup text " * 20, 30, style) for style in _SYSTEM_PROMPTS),
+            return_exceptions=True
+        )
+        for style, result in zip(_SYSTEM_PROMPTS, results):
+            if isinstance(result, Exception):
+                logger.warning(f"OpenAI prompt cache warmup failed for style {style}: {str(result)}")
+        logger.info("OpenAI prompt cache warmup completed")
+    
     async def _summarize_with_openai(self, text: str, max_length: int, style: str) -> Dict[str, Any]:
         """Summarize using OpenAI GPT models"""
         try:
             logger.info(f"Using OpenAI {self.openai_model} for summarization")
             
-            # Create prompt based on style
-            prompt = self._create_openai_prompt(text, style)
-            
             # Call OpenAI API
-            response = openai.ChatCompletion.create(
-                model=self.openai_model,
-                messages=[
-                    {"role": "system", "content": "You are an AI assistant specialized in creating clear and concise summaries."},
-                    {"role": "user", "content": prompt}
-                ],
-                max_tokens=max_length * 2,  # Approximate token count
-                temperature=0.3,
-                top_p=0.9
+            response = await self.openai_client.chat.completions.create(
+                **self._create_openai_params(text, max_length, style)
             )
             
             summary = response.choices[0].message.content.strip()
@@ -108,125 +453,255 @@ class LLMService:
             logger.error(f"OpenAI summarization failed: {str(e)}")
             raise Exception(f"OpenAI summarization failed: {str(e)}")
     
+    async def summarize_stream(self, text: str, max_length: int = 150, style: str = "bullet_points") -> AsyncIterator[str]:
+        """
+        Summarize text, yielding the summary incrementally as it is generated.
+        
+        OpenAI output is streamed token by token. Hugging Face pipelines and
+        cached summaries yield the full summary as a single piece.
+        
+        Args:
+            text: Text to summarize
+            max_length: Maximum length of summary in words
+            style: Summary style (bullet_points, paragraph, executive, technical)
+            
+        Yields:
+            Successive pieces of the summary text
+        """
+        key = self._cache_key(text, max_length, style)
+        cached = self._cache_get(key)
+        if cached is not None:
+            yield cached["summary"]
+            return
+        
+        if self.llm_provider != "openai":
+            result = await self._summarize_with_huggingface(text, max_length, style)
+            await self._cache_put(key, result)
+            yield result["summary"]
+            return
+        
+        logger.info(f"Streaming OpenAI {self.openai_model} summarization")
+        
+        response = await self.openai_client.chat.completions.create(
+            **self._create_openai_params(text, max_length, style),
+            stream=True
+        )
+        
+        parts = []
+        async for chunk in response:
+            if not chunk.choices:
+                continue
+            delta = chunk.choices[0].delta.content
+            if delta:
+                parts.append(delta)
+                yield delta
+        
+        # Accumulate the streamed text so later identical requests hit the cache
+        summary = "".join(parts).strip()
+        word_count = len(summary.split())
+        await self._cache_put(key, {
+            "summary": summary,
+            "word_count": word_count,
+            "model_used": self.openai_model,
+            "provider": "openai"
+        })
+        
+        logger.info(f"OpenAI streaming summarization completed. Word count: {word_count}")
+    
     async def _summarize_with_huggingface(self, text: str, max_length: int, style: str) -> Dict[str, Any]:
         """Summarize using Hugging Face models"""
         try:
             logger.info(f"Using Hugging Face model for summarization")
             
-            # Prepare text for summarization
-            # Split long text into chunks if necessary
-            max_chunk_length = 1024  # Maximum tokens for BART
-            chunks = self._split_text_into_chunks(text, max_chunk_length)
+            results = await self._summarize_many_with_huggingface([text], max_length, style)
             
-            summaries = []
-            for chunk in chunks:
-                # Generate summary for each chunk
-                result = self.summarizer(
-                    chunk,
-                    max_length=max_length,
-                    min_length=30,
-                    do_sample=False,
-                    truncation=True
-                )
-                summaries.append(result[0]['summary_text'])
+            logger.info(f"Hugging Face summarization completed. Word count: {results[0]['word_count']}")
             
-            # Combine summaries if multiple chunks
-            if len(summaries) > 1:
-                combined_summary = " ".join(summaries)
-                # Re-summarize the combined summary if it's still too long
-                if len(combined_summary.split()) > max_length:
-                    result = self.summarizer(
-                        combined_summary,
-                        max_length=max_length,
-                        min_length=30,
-                        do_sample=False,
-                        truncation=True
-                    )
-                    final_summary = result[0]['summary_text']
-                else:
-                    final_summary = combined_summary
-            else:
-                final_summary = summaries[0]
+            return results[0]
             
+        except Exception as e:
+            logger.error(f"Hugging Face summarization failed: {str(e)}")
+            raise Exception(f"Hugging Face summarization failed: {str(e)}")
+    
+    async def _summarize_many_with_huggingface(self, texts: list[str], max_length: int, style: str) -> list[Dict[str, Any]]:
+        """Summarize several texts with Hugging Face models in batched pipeline calls"""
+        # Map: summarize every chunk of every text in batched pipeline calls
+        max_chunk_length = 1024  # Maximum tokens for BART
+        chunks_per_text = self._split_texts_into_chunks(texts, max_chunk_length)
+        combined = await self._summarize_chunks(chunks_per_text, max_length)
+        
+        # Reduce: re-summarize combined chunk summaries that are still too
+        # long, re-chunking them when they no longer fit a single window
+        pending = [
+            i for i, chunks in enumerate(chunks_per_text)
+            if len(chunks) > 1 and len(combined[i].split()) > max_length
+        ]
+        while pending:
+            rechunked = self._split_texts_into_chunks([combined[i] for i in pending], max_chunk_length)
+            for i, summary in zip(pending, await self._summarize_chunks(rechunked, max_length)):
+                combined[i] = summary
+            pending = [
+                i for i, chunks in zip(pending, rechunked)
+                if len(chunks) > 1 and len(combined[i].split()) > max_length
+            ]
+        
+        results = []
+        for final_summary in combined:
             # Apply style formatting
             formatted_summary = self._apply_style_formatting(final_summary, style)
-            word_count = len(formatted_summary.split())
-            
-            logger.info(f"Hugging Face summarization completed. Word count: {word_count}")
-            
-            return {
+            results.append({
                 "summary": formatted_summary,
-                "word_count": word_count,
+                "word_count": len(formatted_summary.split()),
                 "model_used": self.huggingface_model,
                 "provider": "huggingface"
-            }
+            })
+        
+        return results
+    
+    async def _summarize_chunks(self, chunks_per_text: list[list[str]], max_length: int) -> list[str]:
+        """Summarize the chunks of several texts together and join each text's chunk summaries"""
+        all_chunks = [chunk for chunks in chunks_per_text for chunk in chunks]
+        chunk_summaries = await self._run_summarizer(all_chunks, max_length)
+        
+        combined = []
+        position = 0
+        for chunks in chunks_per_text:
+            combined.append(" ".join(chunk_summaries[position:position + len(chunks)]))
+            position += len(chunks)
+        
+        return combined
+    
+    async def _run_summarizer(self, inputs: list[str], max_length: int) -> list[str]:
+        """
+        Queue inputs for the Hugging Face pipeline and wait for their summaries.
+        
+        A single background worker owns the pipeline, so concurrent requests
+        never run it in parallel and are instead coalesced into shared batches.
+        """
+        if self.hf_worker is None or self.hf_worker.done():
+            self.hf_worker = asyncio.create_task(self._huggingface_worker())
+        
+        future = asyncio.get_running_loop().create_future()
+        await self.hf_queue.put((inputs, max_length, future))
+        return await future
+    
+    async def _huggingface_worker(self) -> None:
+        """Drain queued summarizer calls and run them as dynamic batches"""
+        loop = asyncio.get_running_loop()
+        while True:
+            # Wait for one request, then collect whatever else arrives within
+            # the batching window
+            pending = [await self.hf_queue.get()]
+            deadline = loop.time() + self.hf_queue_wait_ms / 1000
+            while len(pending) < self.hf_queue_max_requests:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    pending.append(await asyncio.wait_for(self.hf_queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
             
-        except Exception as e:
-            logger.error(f"Hugging Face summarization failed: {str(e)}")
-            raise Exception(f"Hugging Face summarization failed: {str(e)}")
+            # Requests can only share a pipeline call when max_length matches
+            groups: dict[int, list] = {}
+            for inputs, max_length, future in pending:
+                groups.setdefault(max_length, []).append((inputs, future))
+            
+            for max_length, requests in groups.items():
+                all_inputs = [text for inputs, _ in requests for text in inputs]
+                try:
+                    summaries = await asyncio.to_thread(self._run_pipeline, all_inputs, max_length)
+                except Exception as e:
+                    for _, future in requests:
+                        if not future.done():
+                            future.set_exception(e)
+                    continue
+                
+                position = 0
+                for inputs, future in requests:
+                    if not future.done():
+                        future.set_result(summaries[position:position + len(inputs)])
+                    position += len(inputs)
     
-    def _create_openai_prompt(self, text: str, style: str) -> str:
-        """Create appropriate prompt for OpenAI based on style"""
-        base_prompt = f"Please summarize the following text clearly and concisely. "
-        
-        if style == "bullet_points":
-            base_prompt += "Use bullet points to highlight key information and action items. "
-        elif style == "paragraph":
-            base_prompt += "Provide a coherent paragraph summary. "
-        elif style == "executive":
-            base_prompt += "Create an executive summary suitable for business presentations. "
-        elif style == "technical":
-            base_prompt += "Provide a technical summary with specific details and terminology. "
-        
-        base_prompt += f"Keep the summary under {150} words. Here's the text to summarize:\n\n{text}"
-        
-        return base_prompt
+    def _run_pipeline(self, inputs: list[str], max_length: int) -> list[str]:
+        """Run the Hugging Face pipeline over all inputs in batched forward passes"""
+        results = self.summarizer(
+            inputs,
+            max_length=max_length,
+            min_length=30,
+            do_sample=False,
+            truncation=True,
+            batch_size=min(len(inputs), self.batch_size)
+        )
+        return [result['summary_text'] for result in results]
     
-    def _split_text_into_chunks(self, text: str, max_length: int) -> list[str]:
-        """Split long text into chunks for processing"""
-        words = text.split()
-        chunks = []
-        current_chunk = []
-        current_length = 0
-        
-        for word in words:
-            if current_length + len(word) + 1 <= max_length:
-                current_chunk.append(word)
-                current_length += len(word) + 1
-            else:
-                if current_chunk:
-                    chunks.append(" ".join(current_chunk))
-                current_chunk = [word]
-                current_length = len(word)
+    def _create_openai_params(self, text: str, max_length: int, style: str) -> Dict[str, Any]:
+        """Create chat completion parameters for OpenAI"""
+        return {
+            "model": self.openai_model,
+            # The system message is identical for every request with the same
+            # style so the provider can reuse its cached prefix
+            "messages": self._create_openai_messages(text, style),
+            "max_tokens": max_length * 2,  # Approximate token count
+            "temperature": 0.3,
+            "top_p": 0.9
+        }
+    
+    def _create_openai_messages(self, text: str, style: str) -> list[Dict[str, str]]:
+        """Create chat messages for OpenAI with a static, style-keyed system prefix"""
+        return [
+            {"role": "system", "content": self._create_openai_prompt(style)},
+            {"role": "user", "content": text}
+        ]
+    
+    def _create_openai_prompt(self, style: str) -> str:
+        """Get the prebuilt system prompt for OpenAI based on style (never includes the text)"""
+        return _SYSTEM_PROMPTS[SummaryStyle(style)]
+    
+    def _split_texts_into_chunks(self, texts: list[str], max_length: int) -> list[list[str]]:
+        """Split long texts into overlapping token windows that fit the model input"""
+        # Tokenize all texts in one batched call and slice the ids so no
+        # chunk exceeds the model's token limit, leaving room for the
+        # special tokens
+        ids_per_text = self.tokenizer(texts, add_special_tokens=False)["input_ids"]
+        window = min(max_length, self.tokenizer.model_max_length) - self.tokenizer.num_special_tokens_to_add()
+        
+        # Overlap consecutive windows so words at a boundary keep their context
+        overlap = min(self.chunk_overlap, window // 2)
+        stride = window - overlap
         
-        if current_chunk:
-            chunks.append(" ".join(current_chunk))
+        windows = []
+        window_counts = []
+        for ids in ids_per_text:
+            if len(ids) <= window:
+                window_counts.append(0)
+                continue
+            # Use as few windows as fit the text and spread them evenly, so
+            # consecutive windows share about `overlap` tokens and none is
+            # left carrying only a few new tokens into a whole pass
+            count = math.ceil((len(ids) - overlap) / stride)
+            size = math.ceil((len(ids) + (count - 1) * overlap) / count)
+            starts = [i * (len(ids) - size) // (count - 1) for i in range(count)]
+            windows.extend(ids[start:start + size] for start in starts)
+            window_counts.append(count)
         
-        return chunks
+        # Decode every window in one batched call
+        decoded = self.tokenizer.batch_decode(windows) if windows else []
+        
+        chunks_per_text = []
+        position = 0
+        for text, count in zip(texts, window_counts):
+            if count == 0:
+                chunks_per_text.append([text])
+                continue
+            chunks_per_text.append(decoded[position:position + count])
+            position += count
+        
+        return chunks_per_text
     
     def _apply_style_formatting(self, summary: str, style: str) -> str:
         """Apply style formatting to the summary"""
-        if style == "bullet_points":
-            # Convert sentences to bullet points
-            sentences = re.split(r'[.!?]+', summary)
-            bullet_points = []
-            for sentence in sentences:
-                sentence = sentence.strip()
-                if sentence and len(sentence) > 10:  # Only meaningful sentences
-                    bullet_points.append(f"• {sentence}")
-            return "\n".join(bullet_points)
-        
-        elif style == "executive":
-            # Add executive summary formatting
-            return f"EXECUTIVE SUMMARY:\n\n{summary}"
-        
-        elif style == "technical":
-            # Add technical summary formatting
-            return f"TECHNICAL SUMMARY:\n\n{summary}"
-        
-        else:
-            # Default paragraph style
-            return summary
+        return _STYLE_FORMATTERS[SummaryStyle(style)](summary)
     
     async def get_status(self) -> Dict[str, Any]:
         """Get the status of the LLM service"""
@@ -242,6 +717,7 @@ class LLMService:
                 return {
                     "provider": "huggingface",
                     "model": self.huggingface_model,
+                    "precision": self.huggingface_precision,
                     "available": self.summarizer is not None,
                     "model_loaded": self.summarizer is not None
                 }
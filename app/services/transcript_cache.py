@@ -0,0 +1,121 @@
+"""
+Transcript cache keyed by upload content
+Keeps recent transcripts in memory and persists them as gzip-compressed JSON
+"""
+
+import os
+import gzip
+import json
+import asyncio
+import hashlib
+import logging
+import contextlib
+from typing import Dict, Any, Optional
+from cachetools import LRUCache
+
+logger = logging.getLogger(__name__)
+
+class TranscriptCache:
+    """In-memory LRU of transcripts in front of an on-disk store"""
+    
+    def __init__(self, cache_dir: str, max_entries: int = 256, max_disk_entries: int = 4096):
+        """
+        Args:
+            cache_dir: Directory transcripts are persisted in (empty disables the disk store)
+            max_entries: Number of transcripts kept in memory
+            max_disk_entries: Number of transcripts kept on disk; the least
+                recently used are deleted beyond that
+        """
+        self.cache_dir = cache_dir
+        self.max_disk_entries = max_disk_entries
+        self.memory = LRUCache(maxsize=max_entries)
+        
+        if self.cache_dir:
+            os.makedirs(self.cache_dir, exist_ok=True)
+    
+    @staticmethod
+    def make_key(digest: str, model: str, language: str, settings: str = "") -> str:
+        """
+        Build the cache key for an upload.
+        
+        Args:
+            digest: SHA-256 hex digest of the uploaded bytes
+            model: Whisper model the transcript was produced with
+            language: Requested transcription language
+            settings: Any other decoding settings that change the transcript
+        
+        Returns:
+            str: Cache key
+        """
+        return f"{digest}:{model}:{language}:{settings}"
+    
+    async def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Look up a transcript, falling back to the disk store on a memory miss"""
+        result = self.memory.get(key)
+        if result is not None or not self.cache_dir:
+            return result
+        
+        try:
+            result = await asyncio.to_thread(self._read, self._path(key))
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning("Failed to read cached transcript: %s", e)
+            return None
+        
+        self.memory[key] = result
+        return result
+    
+    async def put(self, key: str, result: Dict[str, Any]) -> None:
+        """Store a transcript in memory and on disk"""
+        self.memory[key] = result
+        if not self.cache_dir:
+            return
+        
+        try:
+            await asyncio.to_thread(self._write, self._path(key), result)
+        except (OSError, TypeError) as e:
+            logger.warning("Failed to persist transcript: %s", e)
+            return
+        
+        try:
+            await asyncio.to_thread(self._evict)
+        except OSError as e:
+            logger.warning("Failed to evict cached transcripts: %s", e)
+    
+    def _path(self, key: str) -> str:
+        """Map a cache key to its file; model names may contain path separators"""
+        name = hashlib.sha256(key.encode("utf-8")).hexdigest()
+        return os.path.join(self.cache_dir, f"{name}.json.gz")
+    
+    def _evict(self) -> None:
+        """Delete the least recently used transcripts beyond max_disk_entries"""
+        with os.scandir(self.cache_dir) as it:
+            entries = [entry for entry in it if entry.name.endswith(".json.gz")]
+        
+        excess = len(entries) - self.max_disk_entries
+        if excess <= 0:
+            return
+        
+        # Reads touch their file, so mtime tracks the last use
+        entries.sort(key=lambda entry: entry.stat().st_mtime)
+        for entry in entries[:excess]:
+            with contextlib.suppress(FileNotFoundError):
+                os.unlink(entry.path)
+    
+    @staticmethod
+    def _read(path: str) -> Dict[str, Any]:
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            result = json.load(f)
+        # Mark the entry as recently used for eviction
+        with contextlib.suppress(OSError):
+            os.utime(path)
+        return result
+    
+    @staticmethod
+    def _write(path: str, result: Dict[str, Any]) -> None:
+        # Write to a temporary name first so readers never see a partial file
+        temp_path = f"{path}.{os.getpid()}.tmp"
+        with gzip.open(temp_path, "wt", encoding="utf-8") as f:
+            json.dump(result, f)
+        os.replace(temp_path, path)
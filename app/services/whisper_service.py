@@ -4,44 +4,92 @@ Supports both local Whisper and OpenAI Whisper API
 """
 
 import os
+import asyncio
 import logging
+import hashlib
 import tempfile
-import aiofiles
-from typing import Dict, Any, Optional
+import contextlib
+import httpx
+from pathlib import Path
+from typing import Dict, Any, AsyncIterator, List, Tuple, Union
 from fastapi import UploadFile
-import whisper
-import openai
+import numpy as np
+from openai import AsyncOpenAI, OpenAIError
 from dotenv import load_dotenv
 
+from app.services.transcript_cache import TranscriptCache
+from app.services.whisper_singleton import get_model, get_pipeline, is_model_loaded, is_valid_model_name
+from app.utils.audio_utils import (
+    SAMPLE_RATE,
+    UPLOAD_CHUNK_SIZE,
+    decode_audio_file,
+    needs_seekable_input,
+    preprocess_audio
+)
+
 # Load environment variables
 load_dotenv()
 
 logger = logging.getLogger(__name__)
 
+# Whisper models work on audio in 30 second windows
+WINDOW_SAMPLES = 30 * SAMPLE_RATE
+
 class WhisperService:
     """Service for handling audio transcription using Whisper"""
     
     def __init__(self):
         self.use_openai_whisper = os.getenv("USE_OPENAI_WHISPER", "false").lower() == "true"
         self.whisper_model = os.getenv("WHISPER_MODEL", "base")
+        self.compute_type = os.getenv("WHISPER_COMPUTE_TYPE", "int8")
+        # Concurrent transcriptions run in parallel on this many model workers
+        self.num_workers = int(os.getenv("WHISPER_NUM_WORKERS", 2))
+        self.cpu_threads = int(os.getenv("WHISPER_CPU_THREADS", 0))
+        if self.cpu_threads == 0:
+            # Split the cores between every model worker of every server
+            # process instead of letting each one claim all of them; start.py
+            # exports the process count, anything else runs a single process
+            processes = int(os.getenv("_SERVER_WORKERS", 1))
+            self.cpu_threads = max(1, (os.cpu_count() or 1) // (processes * self.num_workers))
+        # 30s chunks of one recording decoded per forward pass
+        self.batch_size = int(os.getenv("WHISPER_BATCH_SIZE", 16))
+        
+        # Silero VAD drops silent stretches before they reach the encoder.
+        # Only the streaming path uses this: WhisperModel.transcribe defaults
+        # to 2 s of silence, while the batched pipeline's 160 ms default
+        # already cuts more
+        self.vad_parameters = {
+            "min_silence_duration_ms": int(os.getenv("WHISPER_VAD_MIN_SILENCE_MS", 500))
+        }
+        
         self.openai_api_key = os.getenv("OPENAI_API_KEY")
+        self.openai_client = None
         
-        # Initialize local Whisper model if not using OpenAI
-        self.local_model = None
-        if not self.use_openai_whisper:
-            try:
-                logger.info(f"Loading local Whisper model: {self.whisper_model}")
-                self.local_model = whisper.load_model(self.whisper_model)
-                logger.info("Local Whisper model loaded successfully")
-            except Exception as e:
-                logger.error(f"Failed to load local Whisper model: {str(e)}")
-                raise Exception(f"Failed to initialize Whisper model: {str(e)}")
+        # Transcripts of identical uploads are served from cache
+        self.cache = TranscriptCache(
+            os.getenv("CACHE_DIR", ".cache/transcripts"),
+            max_entries=int(os.getenv("TRANSCRIPT_CACHE_SIZE", 256)),
+            max_disk_entries=int(os.getenv("TRANSCRIPT_CACHE_DISK_SIZE", 4096))
+        )
+        
+        # The local model itself is loaded once per process by
+        # whisper_singleton (at app startup) and shared across requests
+        
+        if not self.use_openai_whisper and not is_valid_model_name(self.whisper_model):
+            raise ValueError(f"Unknown Whisper model: {self.whisper_model}")
         
         # Initialize OpenAI client if using OpenAI Whisper
         if self.use_openai_whisper:
             if not self.openai_api_key:
-                raise Exception("OpenAI API key required when using OpenAI Whisper")
-            openai.api_key = self.openai_api_key
+                raise ValueError("OpenAI API key required when using OpenAI Whisper")
+            # One shared HTTP/2 client so uploads reuse TCP/TLS connections
+            self.openai_client = AsyncOpenAI(
+                api_key=self.openai_api_key,
+                http_client=httpx.AsyncClient(
+                    http2=True,
+                    limits=httpx.Limits(max_connections=32)
+                )
+            )
             logger.info("OpenAI Whisper API configured")
     
     async def transcribe(self, file: UploadFile) -> Dict[str, Any]:
@@ -54,54 +102,210 @@ class WhisperService:
         Returns:
             Dict containing transcript, confidence, language, and duration
         """
-        try:
-            # Save uploaded file to temporary location
-            temp_file = await self._save_uploaded_file(file)
+        # Hash the upload before decoding or sending it anywhere, so a
+        # cache hit skips that work entirely
+        digest = await self._hash_upload(file)
+        
+        if self.use_openai_whisper:
+            model = "whisper-1"
+            settings = ""
+        else:
+            model = self.whisper_model
+            # Quantization changes the local transcript
+            settings = self.compute_type
+        
+        key = TranscriptCache.make_key(digest, model, "auto", settings)
+        cached = await self.cache.get(key)
+        if cached is not None:
+            logger.info("Transcript served from cache")
+            return cached
+        
+        if self.use_openai_whisper:
+            # Save uploaded file to a temporary file for the API upload
+            async with self.spool_upload(file) as temp_file:
+                result = await self._transcribe_with_openai(temp_file, file.filename)
+        else:
+            result = await self._transcribe_with_local(await self._decode_upload(file))
+        
+        await self.cache.put(key, result)
+        return result
+    
+    async def transcribe_batch(self, files: List[UploadFile]) -> List[Union[Dict[str, Any], Exception]]:
+        """
+        Transcribe several audio files concurrently.
+        
+        Each file is transcribed as its own request; on the local model they
+        run in parallel up to WHISPER_NUM_WORKERS, so this is as fast as
+        sending the files in separate concurrent requests, not faster.
+        
+        Args:
+            files: Uploaded audio files
             
-            if self.use_openai_whisper:
-                return await self._transcribe_with_openai(temp_file)
-            else:
-                return await self._transcribe_with_local(temp_file)
-                
+        Returns:
+            One result dict per file, or the exception its transcription raised
+        """
+        return await asyncio.gather(
+            *(self.transcribe(file) for file in files),
+            return_exceptions=True
+        )
+    
+    async def transcribe_stream(self, file_path: str, filename: str) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Transcribe an audio file, yielding segments as soon as they are decoded.
+        
+        The local model decodes segments lazily, so each one is sent as soon
+        as its window has been decoded.
+        
+        Args:
+            file_path: Path to the spooled upload (see spool_upload)
+            filename: Original filename, which tells the OpenAI API the audio format
+            
+        Yields:
+            Dicts with the start, end, and text of each transcribed segment
+        """
+        if self.use_openai_whisper:
+            result = await self._transcribe_with_openai(file_path, filename)
+            for segment in result.get("segments", []):
+                yield {
+                    "start": segment["start"],
+                    "end": segment["end"],
+                    "text": segment["text"].strip()
+                }
+            return
+        
+        logger.info("Streaming local Whisper transcription")
+        segments, _ = await asyncio.to_thread(
+            self._get_model().transcribe,
+            file_path,
+            beam_size=1,
+            vad_filter=True,
+            vad_parameters=self.vad_parameters
+        )
+        
+        # faster-whisper decodes lazily, one segment per iteration
+        segments = iter(segments)
+        while (segment := await asyncio.to_thread(next, segments, None)) is not None:
+            yield {
+                "start": segment.start,
+                "end": segment.end,
+                "text": segment.text.strip()
+            }
+    
+    def _get_model(self):
+        """Get the shared local Whisper model with this service's configuration"""
+        return get_model(self.whisper_model, self.compute_type, self.cpu_threads, self.num_workers)
+    
+    def load_model(self) -> None:
+        """Load the shared local Whisper model if the local provider is used"""
+        if not self.use_openai_whisper:
+            self._get_model()
+    
+    async def warmup(self) -> None:
+        """
+        Run a dummy transcription so the first real request doesn't pay model
+        warmup costs (kernel selection, allocator growth, graph capture).
+        """
+        if self.use_openai_whisper:
+            return
+        
+        try:
+            logger.info("Warming up local Whisper model")
+            # Whisper always encodes a full 30s window, so silence of that
+            # length exercises the steady-state shapes; VAD is disabled so the
+            # silence actually reaches the encoder
+            segments, _ = self._get_model().transcribe(
+                np.zeros(WINDOW_SAMPLES, dtype=np.float32),
+                beam_size=1,
+                vad_filter=False
+            )
+            await asyncio.to_thread(list, segments)
+            logger.info("Local Whisper model warmup completed")
         except Exception as e:
-            logger.error(f"Transcription failed: {str(e)}")
-            raise Exception(f"Transcription failed: {str(e)}")
-        finally:
-            # Clean up temporary file
-            if 'temp_file' in locals():
-                await self._cleanup_temp_file(temp_file)
+            logger.warning("Local Whisper model warmup failed: %s", e)
+    
+    @staticmethod
+    async def _hash_upload(file: UploadFile) -> str:
+        """Get the SHA-256 hex digest of an upload and rewind it for reading"""
+        hasher = hashlib.sha256()
+        while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+            hasher.update(chunk)
+        await file.seek(0)
+        return hasher.hexdigest()
+    
+    async def _decode_upload(self, file: UploadFile) -> np.ndarray:
+        """
+        Decode an upload to the samples Whisper expects.
+        
+        Uploads are piped straight into ffmpeg when possible. MP4-family
+        uploads, and any upload ffmpeg fails to decode from a pipe, are
+        written to a temporary file first so ffmpeg can seek in them.
+        """
+        if not needs_seekable_input(file):
+            try:
+                return await preprocess_audio(file)
+            except RuntimeError as e:
+                logger.warning("Decoding %s from a pipe failed, retrying from a file: %s", file.filename, e)
+                await file.seek(0)
+        
+        async with self.spool_upload(file) as temp_file:
+            return await decode_audio_file(temp_file)
     
-    async def _save_uploaded_file(self, file: UploadFile) -> str:
-        """Save uploaded file to temporary location"""
+    @contextlib.asynccontextmanager
+    async def spool_upload(self, file: UploadFile) -> AsyncIterator[str]:
+        """
+        Write the upload to a temporary file and yield a path to it.
+        
+        On Linux the file is created with O_TMPFILE, so it has no directory
+        entry and is reclaimed by the kernel once its descriptor is closed,
+        even if the process dies. Elsewhere a named temp file is used and
+        unlinked on exit.
+        
+        The O_TMPFILE path is /proc/self/fd/N, so it only opens in this
+        process (PyAV, the OpenAI SDK). Subprocesses such as ffmpeg must
+        inherit descriptor N through pass_fds; the helpers in audio_utils
+        do this.
+        """
         try:
-            # Create temporary file
-            temp_file = tempfile.NamedTemporaryFile(delete=False, suffix=f".{file.filename.split('.')[-1]}")
-            temp_path = temp_file.name
-            temp_file.close()
-            
-            # Write uploaded content to temporary file
-            async with aiofiles.open(temp_path, 'wb') as f:
-                content = await file.read()
-                await f.write(content)
-            
-            logger.info(f"Saved uploaded file to: {temp_path}")
-            return temp_path
+            fd = os.open(tempfile.gettempdir(), os.O_TMPFILE | os.O_RDWR, 0o600)
+            path = f"/proc/self/fd/{fd}"
+            anonymous = True
+        except (AttributeError, OSError):
+            # O_TMPFILE is Linux-only and not every filesystem supports it
+            fd, path = tempfile.mkstemp(suffix=f".{file.filename.rpartition('.')[2]}")
+            anonymous = False
+        
+        try:
+            # Stream uploaded content to the temporary file in chunks so the
+            # whole upload is never held in memory
+            while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+                await asyncio.to_thread(self._write_all, fd, chunk)
             
-        except Exception as e:
-            logger.error(f"Failed to save uploaded file: {str(e)}")
-            raise Exception(f"Failed to save uploaded file: {str(e)}")
+            logger.info("Saved uploaded file to: %s", path)
+            yield path
+        finally:
+            os.close(fd)
+            if not anonymous:
+                with contextlib.suppress(FileNotFoundError):
+                    os.unlink(path)
+    
+    @staticmethod
+    def _write_all(fd: int, data: bytes) -> None:
+        """Write all of data to fd, retrying short writes"""
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
     
-    async def _transcribe_with_openai(self, file_path: str) -> Dict[str, Any]:
-        """Transcribe using OpenAI Whisper API"""
+    async def _transcribe_with_openai(self, file_path: str, filename: str) -> Dict[str, Any]:
+        """Transcribe using OpenAI Whisper API; filename tells the API the audio format"""
         try:
             logger.info("Using OpenAI Whisper API for transcription")
             
-            with open(file_path, 'rb') as audio_file:
-                response = openai.Audio.transcribe(
-                    "whisper-1",
-                    audio_file,
-                    response_format="verbose_json"
-                )
+            response = await self.openai_client.audio.transcriptions.create(
+                model="whisper-1",
+                file=(filename, Path(file_path)),
+                response_format="verbose_json"
+            )
+            response = response.model_dump()
             
             # Extract information from response
             transcript = response.get("text", "")
@@ -111,47 +315,48 @@ class WhisperService:
             # Calculate confidence (OpenAI doesn't provide confidence scores)
             confidence = 0.95  # Default confidence for OpenAI
             
-            logger.info(f"OpenAI transcription completed. Language: {language}, Duration: {duration}s")
+            logger.info("OpenAI transcription completed. Language: %s, Duration: %ss", language, duration)
             
             return {
                 "transcript": transcript,
                 "confidence": confidence,
                 "language": language,
-                "duration": duration
+                "duration": duration,
+                "segments": response.get("segments", [])
             }
             
-        except Exception as e:
-            logger.error(f"OpenAI transcription failed: {str(e)}")
-            raise Exception(f"OpenAI transcription failed: {str(e)}")
+        except OpenAIError as e:
+            logger.error("OpenAI transcription failed: %s", e)
+            raise
     
-    async def _transcribe_with_local(self, file_path: str) -> Dict[str, Any]:
-        """Transcribe using local Whisper model"""
+    async def _transcribe_with_local(self, audio: np.ndarray) -> Dict[str, Any]:
+        """Transcribe 16 kHz float32 samples using local Whisper model"""
         try:
             logger.info("Using local Whisper model for transcription")
             
-            # Transcribe audio
-            result = self.local_model.transcribe(file_path)
+            # Run in a worker thread so concurrent requests overlap on the
+            # model's workers instead of blocking the event loop
+            segments, info = await asyncio.to_thread(self._run_pipeline, audio)
             
             # Extract information from result
-            transcript = result.get("text", "").strip()
-            language = result.get("language", "en")
-            segments = result.get("segments", [])
+            transcript = "".join(segment.text for segment in segments).strip()
+            language = info.language
             
             # Calculate average confidence
             if segments:
-                confidences = [segment.get("avg_logprob", 0) for segment in segments]
-                confidence = sum(confidences) / len(confidences) if confidences else 0.0
+                logprobs = np.fromiter(
+                    (segment.avg_logprob for segment in segments),
+                    dtype=np.float32,
+                    count=len(segments)
+                )
                 # Convert log probability to confidence (0-1 scale)
-                confidence = max(0.0, min(1.0, (confidence + 1) / 2))
+                confidence = float(np.clip((logprobs.mean() + 1) * 0.5, 0.0, 1.0))
             else:
                 confidence = 0.8  # Default confidence
             
-            # Calculate duration from segments
-            duration = 0.0
-            if segments:
-                duration = segments[-1].get("end", 0.0)
+            duration = info.duration
             
-            logger.info(f"Local transcription completed. Language: {language}, Duration: {duration}s")
+            logger.info("Local transcription completed. Language: %s, Duration: %ss", language, duration)
             
             return {
                 "transcript": transcript,
@@ -160,41 +365,34 @@ class WhisperService:
                 "duration": duration
             }
             
-        except Exception as e:
-            logger.error(f"Local transcription failed: {str(e)}")
-            raise Exception(f"Local transcription failed: {str(e)}")
+        except RuntimeError as e:
+            logger.error("Local transcription failed: %s", e)
+            raise
     
-    async def _cleanup_temp_file(self, file_path: str):
-        """Clean up temporary file"""
-        try:
-            if os.path.exists(file_path):
-                os.unlink(file_path)
-                logger.info(f"Cleaned up temporary file: {file_path}")
-        except Exception as e:
-            logger.warning(f"Failed to cleanup temporary file {file_path}: {str(e)}")
+    def _run_pipeline(self, audio: np.ndarray) -> Tuple[List[Any], Any]:
+        """Transcribe one recording, batching its speech chunks through the model"""
+        segments, info = get_pipeline(self._get_model()).transcribe(
+            audio,
+            batch_size=self.batch_size,
+            beam_size=1,
+            vad_filter=True
+        )
+        return list(segments), info
     
     async def get_status(self) -> Dict[str, Any]:
         """Get the status of the Whisper service"""
-        try:
-            if self.use_openai_whisper:
-                return {
-                    "provider": "openai",
-                    "model": "whisper-1",
-                    "available": True,
-                    "api_key_configured": bool(self.openai_api_key)
-                }
-            else:
-                return {
-                    "provider": "local",
-                    "model": self.whisper_model,
-                    "available": self.local_model is not None,
-                    "model_loaded": self.local_model is not None
-                }
-        except Exception as e:
-            logger.error(f"Error getting Whisper status: {str(e)}")
+        if self.use_openai_whisper:
             return {
-                "provider": "unknown",
-                "model": "unknown",
-                "available": False,
-                "error": str(e)
-            } 
\ No newline at end of file
+                "provider": "openai",
+                "model": "whisper-1",
+                "available": True,
+                "api_key_configured": bool(self.openai_api_key)
+            }
+        else:
+            return {
+                "provider": "local",
+                "model": self.whisper_model,
+                "compute_type": self.compute_type,
+                "available": is_model_loaded(),
+                "model_loaded": is_model_loaded()
+            }
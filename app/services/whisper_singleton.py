@@ -0,0 +1,94 @@
+"""
+Process-wide local Whisper model
+Loaded once per process and shared by every request
+"""
+
+import os
+import logging
+import threading
+from typing import Optional
+from faster_whisper import BatchedInferencePipeline, WhisperModel, available_models
+
+logger = logging.getLogger(__name__)
+
+_model: Optional[WhisperModel] = None
+_pipeline: Optional[BatchedInferencePipeline] = None
+_model_lock = threading.Lock()
+
+def is_valid_model_name(name: str) -> bool:
+    """
+    Check a Whisper model name against the known faster-whisper models.
+    
+    Hugging Face repo ids (org/model) and local model directories are also
+    accepted, so a typo fails fast instead of downloading something else.
+    
+    Args:
+        name: Whisper model name, repo id, or path
+        
+    Returns:
+        bool: True if the name can be loaded, False otherwise
+    """
+    return name in available_models() or "/" in name or os.path.isdir(name)
+
+def get_model(name: str, compute_type: str = "int8", cpu_threads: int = 0, num_workers: int = 1) -> WhisperModel:
+    """
+    Get the shared local Whisper model, loading it on first use.
+    
+    Args:
+        name: Whisper model name (tiny, base, small, large-v3, distil-large-v3, ...)
+        compute_type: CTranslate2 compute type (int8, int8_float16, float16, float32)
+        cpu_threads: CTranslate2 threads per inference on CPU (0 uses the runtime default)
+        num_workers: Number of transcriptions CTranslate2 can run in parallel
+            when the model is called from several threads
+        
+    Returns:
+        The loaded faster-whisper model
+    """
+    global _model
+    if _model is None:
+        with _model_lock:
+            if _model is None:
+                try:
+                    logger.info("Loading local Whisper model: %s (%s)", name, compute_type)
+                    _model = WhisperModel(
+                        name,
+                        device="auto",
+                        compute_type=compute_type,
+                        cpu_threads=cpu_threads,
+                        num_workers=num_workers
+                    )
+                    logger.info("Local Whisper model loaded successfully")
+                except (OSError, RuntimeError, ValueError) as e:
+                    logger.error("Failed to load local Whisper model: %s", e)
+                    raise
+    return _model
+
+def get_pipeline(model: WhisperModel) -> BatchedInferencePipeline:
+    """
+    Get the shared batched pipeline over the local Whisper model.
+    
+    The pipeline batches the VAD speech chunks of one recording through the
+    model; concurrent recordings call it from separate threads and run in
+    parallel on the model's workers.
+    
+    Args:
+        model: The shared model returned by get_model
+        
+    Returns:
+        The batched inference pipeline
+    """
+    global _pipeline
+    if _pipeline is None:
+        with _model_lock:
+            if _pipeline is None:
+                _pipeline = BatchedInferencePipeline(model=model)
+    return _pipeline
+
+def is_model_loaded() -> bool:
+    """
+    Check whether the shared local Whisper model has been loaded.
+    
+    Returns:
+        bool: True if the model is loaded, False otherwise
+    """
+    return _model is not None
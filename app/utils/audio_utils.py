@@ -2,12 +2,12 @@
 Audio utilities for validation and preprocessing
 """
 
-import os
+import re
+import asyncio
 import logging
 from typing import List, Tuple
+import numpy as np
 from fastapi import UploadFile
-from pydub import AudioSegment
-import tempfile
 
 logger = logging.getLogger(__name__)
 
@@ -25,7 +25,26 @@ SUPPORTED_FORMATS = {
 }
 
 # File extensions that are supported
-SUPPORTED_EXTENSIONS = ['.mp3', '.wav', '.m4a', '.flac', '.ogg', '.webm']
+SUPPORTED_EXTENSIONS = frozenset({'.mp3', '.wav', '.m4a', '.flac', '.ogg', '.webm'})
+
+# Extensions and content types accepted by validate_audio_file, in one set
+_ALLOWED = SUPPORTED_EXTENSIONS | frozenset(SUPPORTED_FORMATS)
+
+# Size of the chunks uploads are streamed in
+UPLOAD_CHUNK_SIZE = 1 << 20  # 1MB
+
+# Sample rate Whisper models expect
+SAMPLE_RATE = 16000
+
+# MP4-family containers may keep their index (moov atom) at the end of the
+# file, which ffmpeg can only reach on seekable input
+_SEEKABLE_ONLY = frozenset({'audio/mp4', 'audio/x-m4a', '.m4a'})
+
+# ffmpeg output arguments producing the 16 kHz mono float32 samples Whisper expects
+_PCM_OUTPUT_ARGS = ("-ac", "1", "-ar", str(SAMPLE_RATE), "-f", "f32le", "pipe:1")
+
+# Mean volume line printed by ffmpeg's volumedetect filter
+_MEAN_VOLUME = re.compile(r'mean_volume:\s*(-inf|-?[\d.]+) dB')
 
 def validate_audio_file(file: UploadFile) -> bool:
     """
@@ -37,99 +56,167 @@ def validate_audio_file(file: UploadFile) -> bool:
     Returns:
         bool: True if file is valid, False otherwise
     """
-    try:
-        # Check if file has a name
-        if not file.filename:
-            logger.warning("No filename provided")
-            return False
-        
-        # Check file extension
-        file_extension = os.path.splitext(file.filename.lower())[1]
-        if file_extension not in SUPPORTED_EXTENSIONS:
-            logger.warning(f"Unsupported file extension: {file_extension}")
+    # Check if file has a name
+    if not file.filename:
+        logger.warning("No filename provided")
+        return False
+    
+    # Check content type if available
+    if file.content_type:
+        if file.content_type not in _ALLOWED:
+            logger.warning("Unsupported content type: %s", file.content_type)
             return False
-        
-        # Check content type if available
-        if file.content_type:
-            if file.content_type not in SUPPORTED_FORMATS:
-                logger.warning(f"Unsupported content type: {file.content_type}")
-                return False
-        
-        # Check file size (max 50MB)
-        file.file.seek(0, 2)  # Seek to end
-        file_size = file.file.tell()
-        file.file.seek(0)  # Reset to beginning
-        
-        max_size = 50 * 1024 * 1024  # 50MB
-        if file_size > max_size:
-            logger.warning(f"File too large: {file_size} bytes")
+    
+    # Check file extension
+    file_extension = '.' + file.filename.rpartition('.')[2].lower()
+    if file_extension not in _ALLOWED:
+        logger.warning("Unsupported file extension: %s", file_extension)
+        return False
+    
+    # Check file size (max 50MB) from the size recorded while the upload was
+    # parsed rather than seeking through the spooled upload
+    if file.size is not None:
+        if file.size > get_max_file_size():
+            logger.warning("File too large: %s bytes", file.size)
             return False
         
-        if file_size == 0:
+        if file.size == 0:
             logger.warning("Empty file")
             return False
-        
-        logger.info(f"Audio file validation passed: {file.filename}")
-        return True
-        
-    except Exception as e:
-        logger.error(f"Error validating audio file: {str(e)}")
-        return False
+    
+    logger.info("Audio file validation passed: %s", file.filename)
+    return True
 
-async def preprocess_audio(file: UploadFile) -> Tuple[str, str]:
+async def preprocess_audio(file: UploadFile) -> np.ndarray:
     """
     Preprocess audio file for transcription.
-    Converts to appropriate format and saves to temporary file.
+    Pipes the upload through ffmpeg and decodes it straight to the 16 kHz
+    mono float32 samples Whisper expects, without any intermediate files.
     
     Args:
         file: Uploaded audio file
         
     Returns:
-        Tuple[str, str]: (temp_file_path, original_format)
+        np.ndarray: float32 samples in [-1, 1] at 16 kHz
     """
-    try:
-        # Create temporary file
-        temp_file = tempfile.NamedTemporaryFile(delete=False, suffix='.wav')
-        temp_path = temp_file.name
-        temp_file.close()
+    proc = await asyncio.create_subprocess_exec(
+        "ffmpeg", "-hide_banner", "-loglevel", "error",
+        "-i", "pipe:0",
+        *_PCM_OUTPUT_ARGS,
+        stdin=asyncio.subprocess.PIPE,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE
+    )
+    
+    async def feed_upload():
+        # Stream the upload into ffmpeg in chunks while its output is read
+        try:
+            while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+                proc.stdin.write(chunk)
+                await proc.stdin.drain()
+        except (BrokenPipeError, ConnectionResetError):
+            # ffmpeg exited early; its stderr explains why
+            pass
+        finally:
+            proc.stdin.close()
+    
+    _, pcm, stderr = await asyncio.gather(feed_upload(), proc.stdout.read(), proc.stderr.read())
+    await proc.wait()
+    
+    if proc.returncode != 0:
+        raise RuntimeError(stderr.decode(errors="replace").strip() or f"ffmpeg exited with code {proc.returncode}")
+    
+    # ffmpeg already emits float32 samples, so this is a zero-copy view
+    audio = np.frombuffer(pcm, dtype=np.float32)
+    
+    logger.info("Audio preprocessing completed: %s -> %.1fs", file.filename, len(audio) / SAMPLE_RATE)
+    return audio
+
+def needs_seekable_input(file: UploadFile) -> bool:
+    """
+    Check if an upload must be decoded from a file rather than a pipe.
+    
+    Args:
+        file: Uploaded audio file
         
-        # Read uploaded file content
-        content = await file.read()
+    Returns:
+        bool: True for MP4-family uploads, False otherwise
+    """
+    file_extension = '.' + (file.filename or '').rpartition('.')[2].lower()
+    return file.content_type in _SEEKABLE_ONLY or file_extension in _SEEKABLE_ONLY
+
+def _inherited_fds(*paths: str) -> Tuple[int, ...]:
+    """
+    Get the descriptors a subprocess must inherit to open the given paths.
+    
+    Anonymous temp files (see WhisperService.spool_upload) are named
+    /proc/self/fd/N, which only resolves in a child that has descriptor N.
+    
+    Args:
+        *paths: File paths (or other arguments) passed to the subprocess
         
-        # Save to temporary file first
-        temp_input = tempfile.NamedTemporaryFile(delete=False, suffix=os.path.splitext(file.filename)[1])
-        temp_input.write(content)
-        temp_input.close()
+    Returns:
+        Tuple[int, ...]: Descriptor numbers to pass with pass_fds
+    """
+    fds = []
+    for path in paths:
+        head, _, fd = path.rpartition('/')
+        if head == '/proc/self/fd' and fd.isdigit():
+            fds.append(int(fd))
+    return tuple(fds)
+
+async def decode_audio_file(file_path: str) -> np.ndarray:
+    """
+    Decode an audio file on disk to the samples Whisper expects.
+    Used for uploads ffmpeg cannot decode from a pipe.
+    
+    Args:
+        file_path: Path to audio file
         
-        try:
-            # Load audio with pydub
-            audio = AudioSegment.from_file(temp_input.name)
-            
-            # Convert to mono if stereo
-            if audio.channels > 1:
-                audio = audio.set_channels(1)
-            
-            # Normalize audio levels
-            audio = audio.normalize()
-            
-            # Export as WAV for better compatibility
-            audio.export(temp_path, format="wav")
-            
-            logger.info(f"Audio preprocessing completed: {file.filename} -> {temp_path}")
-            return temp_path, "wav"
-            
-        finally:
-            # Clean up temporary input file
-            if os.path.exists(temp_input.name):
-                os.unlink(temp_input.name)
-                
-    except Exception as e:
-        logger.error(f"Error preprocessing audio: {str(e)}")
-        raise Exception(f"Audio preprocessing failed: {str(e)}")
+    Returns:
+        np.ndarray: float32 samples in [-1, 1] at 16 kHz
+    """
+    proc = await asyncio.create_subprocess_exec(
+        "ffmpeg", "-hide_banner", "-loglevel", "error",
+        "-i", file_path,
+        *_PCM_OUTPUT_ARGS,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+        pass_fds=_inherited_fds(file_path)
+    )
+    pcm, stderr = await proc.communicate()
+    
+    if proc.returncode != 0:
+        raise RuntimeError(stderr.decode(errors="replace").strip() or f"ffmpeg exited with code {proc.returncode}")
+    
+    audio = np.frombuffer(pcm, dtype=np.float32)
+    
+    logger.info("Audio decoding completed: %s -> %.1fs", file_path, len(audio) / SAMPLE_RATE)
+    return audio
+
+async def _run_ffmpeg_tool(*args: str) -> Tuple[int, str, str]:
+    """
+    Run an ffmpeg/ffprobe command without blocking the event loop.
+    
+    Args:
+        *args: Command and arguments
+        
+    Returns:
+        Tuple[int, str, str]: (return_code, stdout, stderr)
+    """
+    proc = await asyncio.create_subprocess_exec(
+        *args,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+        pass_fds=_inherited_fds(*args)
+    )
+    stdout, stderr = await proc.communicate()
+    return proc.returncode, stdout.decode(errors="replace"), stderr.decode(errors="replace")
 
-def get_audio_duration(file_path: str) -> float:
+async def get_audio_duration(file_path: str) -> float:
     """
     Get the duration of an audio file in seconds.
+    Reads the duration from the container metadata instead of decoding.
     
     Args:
         file_path: Path to audio file
@@ -138,13 +225,20 @@ def get_audio_duration(file_path: str) -> float:
         float: Duration in seconds
     """
     try:
-        audio = AudioSegment.from_file(file_path)
-        return len(audio) / 1000.0  # Convert milliseconds to seconds
-    except Exception as e:
-        logger.error(f"Error getting audio duration: {str(e)}")
+        returncode, stdout, stderr = await _run_ffmpeg_tool(
+            "ffprobe", "-v", "error",
+            "-show_entries", "format=duration",
+            "-of", "default=nw=1:nk=1",
+            file_path
+        )
+        if returncode != 0:
+            raise RuntimeError(stderr.strip() or f"ffprobe exited with code {returncode}")
+        return float(stdout.strip())
+    except (OSError, RuntimeError, ValueError) as e:
+        logger.error("Error getting audio duration: %s", e)
         return 0.0
 
-def is_audio_file_empty(file_path: str) -> bool:
+async def is_audio_file_empty(file_path: str) -> bool:
     """
     Check if audio file is empty or has no audible content.
     
@@ -155,20 +249,31 @@ def is_audio_file_empty(file_path: str) -> bool:
         bool: True if file is empty, False otherwise
     """
     try:
-        audio = AudioSegment.from_file(file_path)
-        
         # Check if duration is very short (less than 0.5 seconds)
-        if len(audio) < 500:
+        if await get_audio_duration(file_path) < 0.5:
             return True
         
-        # Check if audio is silent (very low volume)
-        if audio.dBFS < -50:
+        # Check if audio is silent (very low volume); volumedetect measures
+        # the mean volume in one pass without writing any output samples
+        returncode, _, stderr = await _run_ffmpeg_tool(
+            "ffmpeg", "-hide_banner", "-nostats",
+            "-i", file_path,
+            "-af", "volumedetect",
+            "-f", "null", "-"
+        )
+        if returncode != 0:
+            raise RuntimeError(stderr.strip() or f"ffmpeg exited with code {returncode}")
+        
+        match = _MEAN_VOLUME.search(stderr)
+        if match is None:
+            return True
+        if match.group(1) == "-inf" or float(match.group(1)) < -50:
             return True
         
         return False
         
-    except Exception as e:
-        logger.error(f"Error checking if audio is empty: {str(e)}")
+    except (OSError, RuntimeError) as e:
+        logger.error("Error checking if audio is empty: %s", e)
         return True
 
 def get_supported_formats() -> List[str]:
@@ -178,7 +283,7 @@ def get_supported_formats() -> List[str]:
     Returns:
         List[str]: List of supported file extensions
     """
-    return SUPPORTED_EXTENSIONS.copy()
+    return sorted(SUPPORTED_EXTENSIONS)
 
 def get_max_file_size() -> int:
     """
@@ -14,16 +14,28 @@ if __name__ == "__main__":
     host = os.getenv("HOST", "0.0.0.0")
     port = int(os.getenv("PORT", 8000))
     debug = os.getenv("DEBUG", "false").lower() == "true"
+    # Each worker loads its own models; set WEB_CONCURRENCY=1 if GPU memory is tight
+    workers = 1 if debug else int(os.getenv("WEB_CONCURRENCY", os.cpu_count()))
+    # Workers inherit the actual count and split the CPU cores between them
+    os.environ["_SERVER_WORKERS"] = str(workers)
     
     print("🚀 Starting Voice-to-Summary AI Notepad Backend...")
     print(f"📍 Server will be available at: http://{host}:{port}")
     print(f"📚 API Documentation: http://{host}:{port}/docs")
     print(f"🔧 Debug mode: {debug}")
+    print(f"👷 Workers: {workers}")
+    print(f"🎙️ Whisper model: {os.getenv('WHISPER_MODEL', 'base')} "
+          "(distil-small.en / distil-large-v3 are faster distilled options)")
     
     uvicorn.run(
         "app.main:app",
         host=host,
         port=port,
         reload=debug,
-        log_level="info"
+        workers=workers,
+        # "auto" picks uvloop and httptools where they are installed
+        loop="auto",
+        http="auto",
+        log_level="info",
+        access_log=False
     ) 
\ No newline at end of file
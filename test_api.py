@@ -1,9 +1,12 @@
 #!/usr/bin/env python3
 """
-Simple test script for Voice-to-Summary AI Notepad Backend 
+Simple test script for Voice-to-Summary AI Notepad Backend
 """
 
-import requests
+import argparse
+import asyncio
+import time
+import httpx
 import json
 import os
 from dotenv import load_dotenv
@@ -13,54 +16,50 @@ load_dotenv()
 
 BASE_URL = "http://localhost:8000"
 
-def test_health_check():
+TEST_TEXT = """
+        This is a test transcript for the Voice-to-Summary AI Notepad backend.
+        The system should be able to process this text and generate a meaningful summary.
+        The summary should highlight the key points and provide a concise overview of the content.
+        """
+
+async def test_health_check(client: httpx.AsyncClient):
     """Test the health check endpoint"""
-    print("🏥 Testing health check...")
     try:
-        response = requests.get(f"{BASE_URL}/health")
+        response = await client.get("/health")
+        print("\n🏥 Testing health check...")
         if response.status_code == 200:
             print("✅ Health check passed")
             print(f"   Response: {response.json()}")
         else:
             print(f"❌ Health check failed: {response.status_code}")
     except Exception as e:
-        print(f"❌ Health check error: {str(e)}")
+        print(f"\n❌ Health check error: {str(e)}")
 
-def test_root_endpoint():
+async def test_root_endpoint(client: httpx.AsyncClient):
     """Test the root endpoint"""
-    print("\n🏠 Testing root endpoint...")
     try:
-        response = requests.get(f"{BASE_URL}/")
+        response = await client.get("/")
+        print("\n🏠 Testing root endpoint...")
         if response.status_code == 200:
             print("✅ Root endpoint passed")
             print(f"   Response: {response.json()}")
         else:
             print(f"❌ Root endpoint failed: {response.status_code}")
     except Exception as e:
-        print(f"❌ Root endpoint error: {str(e)}")
+        print(f"\n❌ Root endpoint error: {str(e)}")
 
-def test_summarize_endpoint():
+async def test_summarize_endpoint(client: httpx.AsyncClient):
     """Test the summarize endpoint"""
-    print("\n📝 Testing summarize endpoint...")
     try:
-        test_text = """
-        This is a test transcript for the Voice-to-Summary AI Notepad backend. 
-        The system should be able to process this text and generate a meaningful summary. 
-        The summary should highlight the key points and provide a concise overview of the content.
-        """
-        
         payload = {
-            "text": test_text,
+            "text": TEST_TEXT,
             "max_length": 50,
             "style": "bullet_points"
         }
         
-        response = requests.post(
-            f"{BASE_URL}/api/v1/summarize",
-            json=payload,
-            headers={"Content-Type": "application/json"}
-        )
+        response = await client.post("/api/v1/summarize", json=payload)
         
+        print("\n📝 Testing summarize endpoint...")
         if response.status_code == 200:
             print("✅ Summarize endpoint passed")
             result = response.json()
@@ -70,60 +69,103 @@ def test_summarize_endpoint():
             print(f"❌ Summarize endpoint failed: {response.status_code}")
             print(f"   Error: {response.text}")
     except Exception as e:
-        print(f"❌ Summarize endpoint error: {str(e)}")
+        print(f"\n❌ Summarize endpoint error: {str(e)}")
 
-def test_transcribe_status():
+async def test_transcribe_status(client: httpx.AsyncClient):
     """Test the transcribe status endpoint"""
-    print("\n🎤 Testing transcribe status...")
     try:
-        response = requests.get(f"{BASE_URL}/api/v1/transcribe/status")
+        response = await client.get("/api/v1/transcribe/status")
+        print("\n🎤 Testing transcribe status...")
         if response.status_code == 200:
             print("✅ Transcribe status passed")
             print(f"   Status: {response.json()}")
         else:
             print(f"❌ Transcribe status failed: {response.status_code}")
     except Exception as e:
-        print(f"❌ Transcribe status error: {str(e)}")
+        print(f"\n❌ Transcribe status error: {str(e)}")
 
-def test_summarize_status():
+async def test_summarize_status(client: httpx.AsyncClient):
     """Test the summarize status endpoint"""
-    print("\n🧠 Testing summarize status...")
     try:
-        response = requests.get(f"{BASE_URL}/api/v1/summarize/status")
+        response = await client.get("/api/v1/summarize/status")
+        print("\n🧠 Testing summarize status...")
         if response.status_code == 200:
             print("✅ Summarize status passed")
             print(f"   Status: {response.json()}")
         else:
             print(f"❌ Summarize status failed: {response.status_code}")
     except Exception as e:
-        print(f"❌ Summarize status error: {str(e)}")
+        print(f"\n❌ Summarize status error: {str(e)}")
+
+async def run_benchmark(client: httpx.AsyncClient, requests: int):
+    """Fire concurrent summarize requests and report latency and throughput"""
+    print(f"\n⏱️ Benchmarking {requests} concurrent summarize requests...")
+    
+    async def timed_request(i: int):
+        # Vary the text so requests are not answered from the summary cache
+        payload = {
+            "text": f"{TEST_TEXT} Request number {i}.",
+            "max_length": 50,
+            "style": "bullet_points"
+        }
+        start = time.perf_counter()
+        try:
+            response = await client.post("/api/v1/summarize", json=payload)
+            ok = response.status_code == 200
+        except Exception:
+            ok = False
+        return time.perf_counter() - start, ok
+    
+    start = time.perf_counter()
+    results = await asyncio.gather(*(timed_request(i) for i in range(requests)))
+    elapsed = time.perf_counter() - start
+    
+    latencies = sorted(latency for latency, _ in results)
+    succeeded = sum(ok for _, ok in results)
+    
+    print(f"   Succeeded: {succeeded}/{requests}")
+    print(f"   Total time: {elapsed:.2f}s ({requests / elapsed:.1f} req/s)")
+    print(f"   Latency p50: {latencies[len(latencies) // 2] * 1000:.0f}ms")
+    print(f"   Latency p95: {latencies[int(len(latencies) * 0.95) - 1] * 1000:.0f}ms")
 
-def main():
+async def main(bench: bool, requests: int):
     """Run all tests"""
     print("🧪 Testing Voice-to-Summary AI Notepad Backend")
     print("=" * 50)
     
-    # Check if server is running
-    try:
-        response = requests.get(f"{BASE_URL}/health", timeout=5)
-        if response.status_code != 200:
+    # Summaries can take a while on the local model, especially under load
+    async with httpx.AsyncClient(base_url=BASE_URL, timeout=300) as client:
+        # Check if server is running
+        try:
+            response = await client.get("/health", timeout=5)
+            if response.status_code != 200:
+                print("❌ Server is not running. Please start the server first:")
+                print("   python start.py")
+                return
+        except httpx.HTTPError:
             print("❌ Server is not running. Please start the server first:")
             print("   python start.py")
             return
-    except:
-        print("❌ Server is not running. Please start the server first:")
-        print("   python start.py")
-        return
-    
-    # Run tests
-    test_health_check()
-    test_root_endpoint()
-    test_summarize_endpoint()
-    test_transcribe_status()
-    test_summarize_status()
+        
+        if bench:
+            await run_benchmark(client, requests)
+        else:
+            # Run tests concurrently
+            await asyncio.gather(
+                test_health_check(client),
+                test_root_endpoint(client),
+                test_summarize_endpoint(client),
+                test_transcribe_status(client),
+                test_summarize_status(client)
+            )
     
     print("\n" + "=" * 50)
     print("✅ All tests completed!")
 
 if __name__ == "__main__":
-    main() 
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--bench", action="store_true", help="Run concurrent summarize requests instead of the smoke tests")
+    parser.add_argument("--requests", type=int, default=100, help="Number of concurrent requests in --bench mode")
+    args = parser.parse_args()
+    
+    asyncio.run(main(args.bench, args.requests))